@@ -1,6 +1,11 @@
 import re
+import json
+import threading
 from pathlib import Path
-from fastapi import FastAPI, UploadFile, File
+from typing import Literal, Optional
+from fastapi import FastAPI, UploadFile, File, Request
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from backend.utils.auth import router as auth_router
 
 
@@ -16,8 +21,10 @@ except Exception:
     remove_bias = lambda x: x
 
 from backend.utils.recommender import RoleRecommender
-from backend.utils.learning_paths import build_learning_plan, build_career_roadmap
+from backend.utils.learning_paths import build_learning_plan, build_career_roadmap, learning_plan_for
 from backend.utils.db import ensure_indexes
+from backend.utils.role_graph import load_for_dataset as load_role_graph
+from backend.utils.response_format import FastJSONResponse, build_compact_response
 
 
 
@@ -27,6 +34,8 @@ DATA_PATH = Path(__file__).resolve().parent / "data" / "it_job_roles.csv"
 
 # global recommender (initialized at startup)
 recommender = None
+# precomputed role graph for roadmaps (built offline with `python -m backend.utils.role_graph`)
+role_graph = None
 
 app.include_router(auth_router, prefix="/api", tags=["auth"])
 
@@ -41,12 +50,23 @@ async def _startup():
     try:
         # instantiate once (costly models loaded here)
         recommender = RoleRecommender(str(DATA_PATH))
-        print("RoleRecommender initialized.")
+        print("RoleRecommender initialized (artifacts: %s)." % (recommender.artifacts.path if recommender.artifacts else "none"))
+        # load the embedding model in the background so the worker accepts connections right away
+        threading.Thread(target=lambda: recommender.embedder, daemon=True).start()
     except Exception as e:
         # fallback: leave recommender None and handle gracefully in endpoint
         print("Failed to initialize RoleRecommender:", e)
         recommender = None
 
+    global role_graph
+    try:
+        role_graph = load_role_graph(DATA_PATH)
+        print("Role graph loaded:", role_graph.meta)
+    except Exception as e:
+        # no graph built for this dataset yet: roadmaps fall back to the generic plan
+        print("Role graph not available:", e)
+        role_graph = None
+
 
 def estimate_experience_from_text(text: str) -> int:
     """
@@ -75,11 +95,11 @@ def tfidf_fallback_recommend(text: str, roles_csv_path: str, top_k: int = 5):
     Lightweight fallback: use TF-IDF on role required_skills text to compute similarity
     if embeddings or heavy models are missing.
     """
-    import pandas as pd
+    from backend.utils.catalog import read_roles_csv
     from sklearn.feature_extraction.text import TfidfVectorizer
     from sklearn.metrics.pairwise import cosine_similarity
 
-    df = pd.read_csv(roles_csv_path, encoding="latin1")
+    df = read_roles_csv(roles_csv_path)
     if "required_skills" not in df.columns or "role" not in df.columns:
         return []
 
@@ -117,8 +137,28 @@ def tfidf_fallback_recommend(text: str, roles_csv_path: str, top_k: int = 5):
     return out
 
 
+def _recommend(resume_text: str, experience: int, top_k: int):
+    """
+    Rank roles with the embedding recommender, falling back to TF-IDF if needed.
+    """
+    try:
+        if recommender is not None:
+            return recommender.recommend_from_text(resume_text, experience_years=experience, top_k=top_k)
+        raise RuntimeError("Recommender not initialized")
+    except Exception as e:
+        # if embeddings fail (model missing / memory issue), fallback to TF-IDF heuristic
+        print("Primary recommender failed, falling back to TF-IDF:", e)
+        return tfidf_fallback_recommend(resume_text, str(DATA_PATH), top_k=top_k)
+
+
 @app.post("/api/analyze")
-async def analyze_resume(file: UploadFile = File(...), top_k: int = 5):
+async def analyze_resume(
+    file: UploadFile = File(...),
+    top_k: int = 5,
+    target_role: Optional[str] = None,
+    format: Literal["full", "compact"] = "full",
+    include_text: bool = True,
+):
     """
     Main analyze endpoint:
     - extracts text
@@ -126,24 +166,18 @@ async def analyze_resume(file: UploadFile = File(...), top_k: int = 5):
     - estimates experience
     - runs recommender (embedding-based), falling back to TF-IDF if needed
     - builds learning plan for missing skills
-    - returns JSON matching frontend expectations
+    - builds a roadmap from the top role (towards target_role if given)
+    - returns JSON matching frontend expectations, or the compact format
+      (utils/response_format.py) with format=compact
     """
     contents = await file.read()
-    resume_text = extract_text(file.filename, contents)
+    resume_text = await run_in_threadpool(extract_text, file.filename, contents)
     resume_text = remove_bias(resume_text)
 
     experience = estimate_experience_from_text(resume_text)
 
-    # 1) try the main recommender
-    try:
-        if recommender is not None:
-            recs = recommender.recommend_from_text(resume_text, experience_years=experience, top_k=top_k)
-        else:
-            raise RuntimeError("Recommender not initialized")
-    except Exception as e:
-        # if embeddings fail (model missing / memory issue), fallback to TF-IDF heuristic
-        print("Primary recommender failed, falling back to TF-IDF:", e)
-        recs = tfidf_fallback_recommend(resume_text, str(DATA_PATH), top_k=top_k)
+    # 1) try the main recommender; off the event loop, since it may wait for the model to finish loading
+    recs = await run_in_threadpool(_recommend, resume_text, experience, top_k)
 
     # 2) collect missing skills across all recs and map to courses
     all_missing = set()
@@ -152,31 +186,91 @@ async def analyze_resume(file: UploadFile = File(...), top_k: int = 5):
 
     courses_map = build_learning_plan(list(all_missing)) if all_missing else {}
 
-    # 3) attach learning_plan to each recommendation
-    results = []
-    for r in recs:
-        lp = []
-        for ms in r.get("missing_skills", []):
-            if ms in courses_map:
-                for c in courses_map[ms]:
-                    lp.append({
-                        "skill": ms,
-                        "steps": [c.get("course_title")],
-                        "project_idea": f"Build a small project using {ms}",
-                        "estimated_hours": c.get("duration_hours", 0),
-                        "platform": c.get("platform", "")
-                    })
-        results.append({**r, "learning_plan": lp})
-
-    # 4) simple roadmap (extendable)
-    roadmap = build_career_roadmap(results[0]["role"]) if results else []
+    # 3) roadmap: shortest path in the role graph when a target role is given
+    roadmap = build_career_roadmap(recs[0]["role"], target_role, role_graph, recs[0].get("role_id")) if recs else []
+
+    # 4) compact format: skills/courses emitted once and referenced by index
+    if format == "compact":
+        return FastJSONResponse(
+            build_compact_response(resume_text, experience, recs, courses_map, roadmap, include_text=include_text)
+        )
+
+    # attach learning_plan to each recommendation
+    results = [{**r, "learning_plan": learning_plan_for(r, courses_map)} for r in recs]
+    extracted = {"resume_text": resume_text[:3000]} if include_text else {}
+    extracted["estimated_experience_years"] = experience
 
     return {
-        "extracted": {"resume_text": resume_text[:3000], "estimated_experience_years": experience},
+        "extracted": extracted,
         "recommendations": results,
         "roadmap": roadmap,
     }
 
+
+def _sse(event: str, data) -> str:
+    """Format one server-sent event frame (numpy scalars from pandas are unboxed)."""
+    payload = json.dumps(data, default=lambda o: o.item() if hasattr(o, "item") else str(o))
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+@app.post("/api/analyze/stream")
+async def analyze_resume_stream(request: Request, file: UploadFile = File(...), top_k: int = 5,
+                                target_role: Optional[str] = None):
+    """
+    Streaming variant of /api/analyze (server-sent events).
+    Emits one event per stage as soon as it is ready:
+    - extracted: resume text + estimated experience
+    - recommendations: ranked roles (without learning plans)
+    - learning_plan: one event per role, in rank order ({"index", "role", "learning_plan"})
+    - roadmap: career roadmap for the top role
+    - done
+    - error: {"error": message} if a later stage fails; no further events follow
+    The resume is parsed before the stream starts, so an unreadable upload fails with a
+    regular error status like /api/analyze.
+    Learning plans for lower-ranked roles are skipped if the client disconnects.
+    """
+    contents = await file.read()
+    resume_text = await run_in_threadpool(extract_text, file.filename, contents)
+    resume_text = remove_bias(resume_text)
+    experience = estimate_experience_from_text(resume_text)
+
+    async def events():
+        yield _sse("extracted", {"resume_text": resume_text[:3000], "estimated_experience_years": experience})
+        try:
+            recs = await run_in_threadpool(_recommend, resume_text, experience, top_k)
+            yield _sse("recommendations", recs)
+
+            # look courses up role by role so the top role's plan arrives first;
+            # skills shared between roles are only looked up once
+            courses_map = {}
+            for i, r in enumerate(recs):
+                if await request.is_disconnected():
+                    print("Client disconnected, skipping remaining learning plans")
+                    return
+                todo = [ms for ms in r.get("missing_skills", []) if ms and ms not in courses_map]
+                if todo:
+                    courses_map.update(await run_in_threadpool(build_learning_plan, todo))
+                yield _sse("learning_plan", {
+                    "index": i,
+                    "role": r["role"],
+                    "learning_plan": learning_plan_for(r, courses_map),
+                })
+
+            roadmap = build_career_roadmap(recs[0]["role"], target_role, role_graph, recs[0].get("role_id")) if recs else []
+            yield _sse("roadmap", roadmap)
+        except Exception as e:
+            # headers are already sent, so report the failure in-band instead of truncating the stream
+            print("Streaming analysis failed:", e)
+            yield _sse("error", {"error": str(e)})
+            return
+        yield _sse("done", {})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
 from fastapi import Form
 from typing import List
 
@@ -0,0 +1,233 @@
+# utils/artifacts.py
+"""
+Versioned, read-only artifacts shared by all API workers.
+
+A build step embeds the role catalog once and writes, under
+data/artifacts/v<FORMAT_VERSION>-<fingerprint>/:
+    role_matrix.npy         float32 (roles x dim) role embeddings, in CSV row order
+    skill_vocab_{blob,offsets}.npy   sorted skill vocabulary (catalog.StringTable layout)
+    role_skill_indptr.npy            CSR offsets of each role's skills
+    role_skill_indices.npy           CSR skill ids into the vocabulary
+    glossary_{blob,offsets}.npy      skill_extractor glossary (catalog.StringTable layout)
+    manifest.json
+The fingerprint hashes the dataset contents and the model name, so a changed catalog
+or model gets a new directory. Workers memory-map every .npy file, so the OS page cache
+holds a single copy for every process on the node. The exceptions are small per-worker
+structures built on top: the glossary is decoded into a list of str because rapidfuzz
+matches against Python strings, and RoleCatalog builds a skill->id dict on first lookup.
+
+Measure per-worker memory and startup with and without artifacts:
+    python -m backend.utils.artifacts --measure 4
+
+Build with (from the it-career-recommender directory):
+    python -m backend.utils.artifacts
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import List, NamedTuple, Optional
+
+import numpy as np
+
+from .catalog import StringTable
+from .embeddings import DEFAULT_MODEL
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+DATASET_PATH = BASE_DIR / "data" / "it_job_roles.csv"
+ARTIFACTS_DIR = Path(os.getenv("ARTIFACTS_DIR", BASE_DIR / "data" / "artifacts"))
+
+FORMAT_VERSION = 3
+
+
+class Artifacts(NamedTuple):
+    path: Path
+    manifest: dict
+    role_matrix: np.ndarray
+    skill_vocab: StringTable
+    role_skill_indptr: np.ndarray
+    role_skill_indices: np.ndarray
+
+
+def fingerprint(dataset_path: str | Path, model_name: str = DEFAULT_MODEL) -> str:
+    h = hashlib.sha256()
+    with open(dataset_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    h.update(f"|{model_name}|{FORMAT_VERSION}".encode("utf-8"))
+    return h.hexdigest()[:16]
+
+
+def artifact_dir(dataset_path: str | Path, model_name: str = DEFAULT_MODEL, root: Path = ARTIFACTS_DIR) -> Path:
+    return Path(root) / f"v{FORMAT_VERSION}-{fingerprint(dataset_path, model_name)}"
+
+
+def load_artifacts(dataset_path: str | Path, model_name: str = DEFAULT_MODEL,
+                   root: Path = ARTIFACTS_DIR) -> Optional[Artifacts]:
+    """Memory-map the artifacts built for this dataset/model, or None if there are none."""
+    path = artifact_dir(dataset_path, model_name, root)
+    if not (path / "manifest.json").exists():
+        return None
+    with open(path / "manifest.json", encoding="utf-8") as f:
+        manifest = json.load(f)
+    return Artifacts(
+        path=path,
+        manifest=manifest,
+        role_matrix=np.load(path / "role_matrix.npy", mmap_mode="r"),
+        skill_vocab=StringTable.load(path, "skill_vocab"),
+        role_skill_indptr=np.load(path / "role_skill_indptr.npy", mmap_mode="r"),
+        role_skill_indices=np.load(path / "role_skill_indices.npy", mmap_mode="r"),
+    )
+
+
+def load_glossary(dataset_path: str | Path = DATASET_PATH, model_name: str = DEFAULT_MODEL,
+                  root: Path = ARTIFACTS_DIR) -> Optional[List[str]]:
+    path = artifact_dir(dataset_path, model_name, root)
+    if not (path / "manifest.json").exists():
+        return None
+    # rapidfuzz needs str objects, so the mapped table is decoded once per process
+    return list(StringTable.load(path, "glossary"))
+
+
+def build_artifacts(dataset_path: str | Path = DATASET_PATH, model_name: str = DEFAULT_MODEL,
+                    root: Path = ARTIFACTS_DIR) -> Path:
+    """Embed the catalog and write the artifact directory; no-op if it already exists."""
+    from .catalog import read_roles_csv
+    from .embeddings import Embedder
+    from .recommender import split_skills
+    from .skill_extractor import build_gazetteer
+
+    target = artifact_dir(dataset_path, model_name, root)
+    if (target / "manifest.json").exists():
+        return target
+
+    df = read_roles_csv(dataset_path)
+    if "role" not in df.columns or "required_skills" not in df.columns:
+        raise ValueError("Dataset must have columns: role, required_skills")
+    # same per-role skill sets RoleCatalog builds (sorted, de-duplicated)
+    skills_lists = [sorted(set(split_skills(s))) for s in df["required_skills"]]
+
+    embedder = Embedder(model_name)
+    dim = embedder.model.get_sentence_embedding_dimension()
+    matrix = np.empty((len(skills_lists), dim), dtype=np.float32)
+    for i, skills in enumerate(skills_lists):
+        matrix[i] = embedder.encode_mean(skills if skills else [""])[0]
+
+    vocab = sorted({s for skills in skills_lists for s in skills})
+    vid = {s: i for i, s in enumerate(vocab)}
+    indptr = np.zeros(len(skills_lists) + 1, dtype=np.int64)
+    indices = []
+    for i, skills in enumerate(skills_lists):
+        indices.extend(vid[s] for s in skills)
+        indptr[i + 1] = len(indices)
+
+    # write into a temp dir next to the target and rename, so workers never see a partial build
+    Path(root).mkdir(parents=True, exist_ok=True)
+    tmp = Path(tempfile.mkdtemp(prefix=".building-", dir=root))
+    try:
+        np.save(tmp / "role_matrix.npy", matrix)
+        np.save(tmp / "role_skill_indptr.npy", indptr)
+        np.save(tmp / "role_skill_indices.npy", np.array(indices, dtype=np.int32))
+        StringTable(vocab).save(tmp, "skill_vocab")
+        StringTable(build_gazetteer(dataset_path)).save(tmp, "glossary")
+        with open(tmp / "manifest.json", "w", encoding="utf-8") as f:
+            json.dump({
+                "format_version": FORMAT_VERSION,
+                "fingerprint": fingerprint(dataset_path, model_name),
+                "model": model_name,
+                "dataset": str(dataset_path),
+                "roles": len(skills_lists),
+                "dim": dim,
+                "skills": len(vocab),
+                "built_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            }, f, indent=2)
+        os.replace(tmp, target)
+    except OSError:
+        shutil.rmtree(tmp, ignore_errors=True)
+        if not (target / "manifest.json").exists():
+            raise
+    return target
+
+
+def _proc_memory_kb() -> dict:
+    """VmRSS and PSS of this process from /proc (Linux); PSS splits shared pages between processes."""
+    out = {}
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                out["rss_kb"] = int(line.split()[1])
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            for line in f:
+                if line.startswith("Pss:"):
+                    out["pss_kb"] = int(line.split()[1])
+    except OSError:
+        pass
+    return out
+
+
+def _measure_worker(dataset_path: str, use_artifacts: bool, barrier, results):
+    t0 = time.perf_counter()
+    from .recommender import RoleRecommender
+
+    rec = RoleRecommender(dataset_path, use_artifacts=use_artifacts)
+    float(np.asarray(rec.role_matrix).sum())  # touch every page of the role matrix, as scoring does
+    startup = time.perf_counter() - t0
+    # app.py loads the model in the background right after startup, so steady state includes it in both modes
+    rec.embedder
+    ready = time.perf_counter() - t0
+    # measure once every worker is up, so shared pages are split across all of them in PSS
+    barrier.wait()
+    results.put({"startup_s": round(startup, 2), "ready_s": round(ready, 2), **_proc_memory_kb()})
+    barrier.wait()
+
+
+def measure_workers(dataset_path: str | Path, workers: int, use_artifacts: bool) -> List[dict]:
+    """Start workers processes that each build a RoleRecommender, as uvicorn workers do at startup."""
+    import multiprocessing as mp
+
+    ctx = mp.get_context("spawn")
+    barrier, results = ctx.Barrier(workers), ctx.Queue()
+    procs = [ctx.Process(target=_measure_worker, args=(str(dataset_path), use_artifacts, barrier, results))
+             for _ in range(workers)]
+    for p in procs:
+        p.start()
+    stats = [results.get() for _ in procs]
+    for p in procs:
+        p.join()
+    return stats
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build shared, memory-mapped recommender artifacts")
+    parser.add_argument("--dataset", default=str(DATASET_PATH))
+    parser.add_argument("--model", default=DEFAULT_MODEL)
+    parser.add_argument("--out", default=str(ARTIFACTS_DIR))
+    parser.add_argument("--measure", type=int, default=0, metavar="N",
+                        help="after building, compare N workers starting with and without artifacts (Linux)")
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    path = build_artifacts(args.dataset, args.model, Path(args.out))
+    print(f"Artifacts ready in {time.perf_counter() - t0:.1f}s -> {path}")
+
+    if args.measure:
+        os.environ["ARTIFACTS_DIR"] = args.out  # spawned workers resolve ARTIFACTS_DIR at import
+        print("startup = catalog ready to serve; ready = embedding model loaded as well. Memory is measured at "
+              "steady state with the model loaded in both modes, so the difference is the shared mmap pages "
+              "plus the catalog embedding work each rebuild does.")
+        print(f"{'mode':<18}{'startup s':>11}{'ready s':>9}{'RSS MB':>10}{'PSS MB':>10}   "
+              f"(mean per worker, {args.measure} workers)")
+        for label, use in (("rebuild in-proc", False), ("mmap artifacts", True)):
+            stats = measure_workers(args.dataset, args.measure, use)
+
+            def mean(key):
+                return sum(s.get(key, 0) for s in stats) / len(stats)
+
+            print(f"{label:<18}{mean('startup_s'):>11.2f}{mean('ready_s'):>9.2f}"
+                  f"{mean('rss_kb') / 1024:>10.1f}{mean('pss_kb') / 1024:>10.1f}")
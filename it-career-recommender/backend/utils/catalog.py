@@ -0,0 +1,277 @@
+# utils/catalog.py
+"""
+Compact, columnar role catalog used by RoleRecommender.
+
+Instead of a DataFrame with Python-list and per-row ndarray object columns, roles are held as:
+    names              StringTable (one utf-8 buffer + offsets)
+    min_experience     int16 array
+    valid              bool array (False for blank CSV rows, never recommended)
+    skill_vocab        sorted StringTable; skill ids therefore sort like the skill names
+    skill_indptr/ids   CSR offsets / skill ids per role
+    embeddings         one float32 (roles x dim) array, possibly memory-mapped from artifacts
+Rows stay aligned with the CSV (and with the artifact role matrix). Descriptions and
+certifications are not used for scoring and are only read from the CSV on first access.
+
+Compare memory against the DataFrame layout with:
+    python -m backend.utils.catalog --replicate 100
+"""
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+class StringTable:
+    """
+    Immutable strings packed into one utf-8 buffer with int64 offsets.
+    The buffer may be bytes or a (memory-mapped) uint8 array, see save() / load().
+    """
+
+    def __init__(self, strings: Iterable[str]):
+        encoded = [s.encode("utf-8") for s in strings]
+        self.offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        if encoded:
+            np.cumsum([len(b) for b in encoded], out=self.offsets[1:])
+        self.blob = b"".join(encoded)
+
+    @classmethod
+    def from_buffers(cls, blob, offsets: np.ndarray) -> "StringTable":
+        table = cls.__new__(cls)
+        table.blob = blob
+        table.offsets = offsets
+        return table
+
+    def save(self, directory: Path, name: str):
+        np.save(Path(directory) / f"{name}_blob.npy", np.frombuffer(bytes(self.blob), dtype=np.uint8))
+        np.save(Path(directory) / f"{name}_offsets.npy", np.asarray(self.offsets, dtype=np.int64))
+
+    @classmethod
+    def load(cls, directory: Path, name: str) -> "StringTable":
+        """Memory-map a table written by save()."""
+        return cls.from_buffers(
+            np.load(Path(directory) / f"{name}_blob.npy", mmap_mode="r"),
+            np.load(Path(directory) / f"{name}_offsets.npy", mmap_mode="r"),
+        )
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i: int) -> str:
+        return bytes(self.blob[self.offsets[i]:self.offsets[i + 1]]).decode("utf-8")
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.blob) + self.offsets.nbytes
+
+
+def read_roles_csv(path, **kwargs) -> pd.DataFrame:
+    """
+    Read a roles CSV as UTF-8 (catalogs written by job_crawler), falling back to
+    latin1 for the bundled it_job_roles.csv, which is not valid UTF-8.
+    """
+    try:
+        return pd.read_csv(path, encoding="utf-8", **kwargs)
+    except UnicodeDecodeError:
+        return pd.read_csv(path, encoding="latin1", **kwargs)
+
+
+def _column_strings(series: pd.Series) -> List[str]:
+    return ["" if pd.isna(v) else str(v) for v in series]
+
+
+class RoleCatalog:
+    def __init__(self, names: StringTable, min_experience: np.ndarray, valid: np.ndarray,
+                 skill_vocab: StringTable, skill_indptr: np.ndarray, skill_ids: np.ndarray,
+                 embeddings: Optional[np.ndarray] = None, dataset_path: Optional[str] = None):
+        self.names = names
+        self.min_experience = min_experience
+        self.valid = valid
+        self.skill_vocab = skill_vocab
+        self.skill_indptr = skill_indptr
+        self.skill_ids = skill_ids
+        self.embeddings = embeddings
+        self.dataset_path = dataset_path
+        self._skill_index: Optional[Dict[str, int]] = None
+        self._name_index: Optional[Dict[str, int]] = None
+        self._lazy: Dict[str, StringTable] = {}
+
+    # ---------------------------
+    # Construction
+    # ---------------------------
+    @staticmethod
+    def _read_columns(dataset_path: str, columns: List[str]) -> pd.DataFrame:
+        df = read_roles_csv(dataset_path, usecols=lambda c: c in columns)
+        if "role" not in df.columns or ("required_skills" in columns and "required_skills" not in df.columns):
+            raise ValueError("Dataset must have columns: role, required_skills")
+        return df
+
+    @staticmethod
+    def _experience(df: pd.DataFrame) -> np.ndarray:
+        if "min_experience" not in df.columns:
+            return np.zeros(len(df), dtype=np.int16)
+        exp = pd.to_numeric(df["min_experience"], errors="coerce").fillna(0)
+        return exp.clip(0, np.iinfo(np.int16).max).to_numpy(dtype=np.int16)
+
+    @classmethod
+    def from_csv(cls, dataset_path: str) -> "RoleCatalog":
+        """Parse role, required_skills and min_experience; embeddings are left to the caller."""
+        from .recommender import split_skills
+
+        df = cls._read_columns(dataset_path, ["role", "required_skills", "min_experience"])
+        skills_lists = [sorted(set(split_skills(s))) for s in df["required_skills"]]
+        vocab = sorted({s for skills in skills_lists for s in skills})
+        vid = {s: i for i, s in enumerate(vocab)}
+
+        indptr = np.zeros(len(skills_lists) + 1, dtype=np.int64)
+        np.cumsum([len(skills) for skills in skills_lists], out=indptr[1:])
+        ids = np.fromiter((vid[s] for skills in skills_lists for s in skills), dtype=np.int32, count=int(indptr[-1]))
+
+        return cls(
+            names=StringTable(_column_strings(df["role"])),
+            min_experience=cls._experience(df),
+            valid=df["role"].notna().to_numpy(),
+            skill_vocab=StringTable(vocab),
+            skill_indptr=indptr,
+            skill_ids=ids,
+            dataset_path=str(dataset_path),
+        )
+
+    @classmethod
+    def from_artifacts(cls, dataset_path: str, artifacts) -> "RoleCatalog":
+        """Skills and embeddings come memory-mapped from utils.artifacts; only names/experience are parsed."""
+        df = cls._read_columns(dataset_path, ["role", "min_experience"])
+        return cls(
+            names=StringTable(_column_strings(df["role"])),
+            min_experience=cls._experience(df),
+            valid=df["role"].notna().to_numpy(),
+            skill_vocab=artifacts.skill_vocab,
+            skill_indptr=artifacts.role_skill_indptr,
+            skill_ids=artifacts.role_skill_indices,
+            embeddings=artifacts.role_matrix,
+            dataset_path=str(dataset_path),
+        )
+
+    # ---------------------------
+    # Lookups
+    # ---------------------------
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def name(self, i: int) -> str:
+        return self.names[i]
+
+    def skill_id_slice(self, i: int) -> np.ndarray:
+        return self.skill_ids[self.skill_indptr[i]:self.skill_indptr[i + 1]]
+
+    def skills(self, i: int) -> List[str]:
+        return [self.skill_vocab[s] for s in self.skill_id_slice(i)]
+
+    def skill_ids_for(self, skills: Iterable[str]) -> set:
+        """Ids of the given (normalized) skills that appear in the catalog vocabulary."""
+        if self._skill_index is None:
+            self._skill_index = {s: i for i, s in enumerate(self.skill_vocab)}
+        return {self._skill_index[s] for s in skills if s in self._skill_index}
+
+    def find(self, role: str) -> Optional[int]:
+        """Row of the role with this name (case-insensitive), or None."""
+        if self._name_index is None:
+            self._name_index = {}
+            for i in range(len(self)):
+                if self.valid[i]:
+                    self._name_index.setdefault(self.names[i].lower(), i)
+        return self._name_index.get(role.lower())
+
+    def _lazy_column(self, column: str) -> StringTable:
+        table = self._lazy.get(column)
+        if table is None:
+            if self.dataset_path is None:
+                raise ValueError("Catalog has no dataset path to load descriptions from")
+            df = read_roles_csv(self.dataset_path, usecols=lambda c: c == column)
+            values = _column_strings(df[column]) if column in df.columns else [""] * len(self)
+            table = self._lazy[column] = StringTable(values)
+        return table
+
+    def description(self, i: int) -> str:
+        return self._lazy_column("description")[i]
+
+    def certifications(self, i: int) -> str:
+        return self._lazy_column("certifications")[i]
+
+    # ---------------------------
+    # Memory accounting
+    # ---------------------------
+    def nbytes(self) -> Dict[str, int]:
+        out = {
+            "names": self.names.nbytes,
+            "min_experience": self.min_experience.nbytes + self.valid.nbytes,
+            "skill_vocab": self.skill_vocab.nbytes,
+            "skills_csr": self.skill_indptr.nbytes + self.skill_ids.nbytes,
+            "embeddings": self.embeddings.nbytes if self.embeddings is not None else 0,
+        }
+        out["total"] = sum(out.values())
+        return out
+
+
+if __name__ == "__main__":
+    import argparse
+    import tempfile
+    import tracemalloc
+
+    from .recommender import split_skills
+
+    parser = argparse.ArgumentParser(description="Memory of the DataFrame role layout vs RoleCatalog")
+    parser.add_argument("--dataset", default=str(Path(__file__).resolve().parent.parent / "data" / "it_job_roles.csv"))
+    parser.add_argument("--replicate", type=int, default=1, help="repeat the catalog N times to simulate larger ones")
+    parser.add_argument("--dim", type=int, default=384, help="embedding dimension (random vectors, no model needed)")
+    args = parser.parse_args()
+
+    base = read_roles_csv(args.dataset)
+    if args.replicate > 1:
+        copies = []
+        for k in range(args.replicate):
+            c = base.copy()
+            c["role"] = c["role"] + f" #{k}"
+            copies.append(c)
+        base = pd.concat(copies, ignore_index=True)
+    n = len(base)
+    rng = np.random.default_rng(0)
+
+    # scratch copy of the (replicated) catalog lives outside the repo and is removed by the OS tmp cleanup at worst
+    with tempfile.TemporaryDirectory(prefix="catalog-report-") as tmp:
+        path = Path(tmp) / "roles.csv"
+        base.to_csv(path, index=False, encoding="utf-8")
+
+        def legacy():
+            # the previous RoleRecommender layout: full DataFrame + skills_list / vec object columns
+            df = read_roles_csv(path)
+            df["skills_list"] = df["required_skills"].apply(split_skills)
+            df["min_experience"] = 0
+            df["vec"] = [rng.standard_normal((1, args.dim)).astype(np.float32) for _ in range(n)]
+            return df
+
+        def compact():
+            cat = RoleCatalog.from_csv(str(path))
+            cat.embeddings = np.empty((n, args.dim), dtype=np.float32)
+            for i in range(n):
+                cat.embeddings[i] = rng.standard_normal(args.dim).astype(np.float32)
+            return cat
+
+        results = {}
+        for label, build in (("DataFrame layout", legacy), ("RoleCatalog", compact)):
+            tracemalloc.start()
+            obj = build()
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            results[label] = (current, peak, obj)
+
+    mb = 1024 * 1024
+    print(f"roles: {n}, embedding dim: {args.dim}")
+    print(f"{'layout':<20}{'retained MB':>14}{'peak MB':>10}")
+    for label, (current, peak, _) in results.items():
+        print(f"{label:<20}{current / mb:>14.2f}{peak / mb:>10.2f}")
+    print("RoleCatalog breakdown (bytes):", results["RoleCatalog"][2].nbytes())
+    print(f"reduction: {results['DataFrame layout'][0] / max(1, results['RoleCatalog'][0]):.1f}x retained")
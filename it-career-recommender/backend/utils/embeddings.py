@@ -1,9 +1,10 @@
 from typing import List
 import numpy as np
-from sentence_transformers import SentenceTransformer
+
+DEFAULT_MODEL = "all-MiniLM-L6-v2"
 
 class Embedder:
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+    def __init__(self, model_name: str = DEFAULT_MODEL):
         from sentence_transformers import SentenceTransformer
         self.model = SentenceTransformer(model_name)
 
@@ -1,11 +1,431 @@
 # utils/job_crawler.py
-import pandas as pd
+"""
+Job-posting ingestion.
+
+Streams large JSONL/CSV dumps of job postings in chunks, normalizes skills into the
+recommender's format (lowercase, comma-separated, aliases resolved), collapses
+near-duplicate postings with MinHash/LSH and aggregates the rest per role into a
+compact catalog CSV that RoleRecommender and build_gazetteer load directly:
+    role, description, required_skills, certifications, min_experience
+
+Usage (from the it-career-recommender directory):
+    python -m backend.utils.job_crawler dumps/postings.jsonl.gz dumps/more.csv --out backend/data/it_job_roles_ingested.csv
+"""
+import gzip
+import hashlib
+import json
+import re
+import time
+from collections import Counter
 from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .catalog import read_roles_csv
+from .skill_extractor import normalize_skill
+
+DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "it_job_roles.csv"
+
+CATALOG_COLUMNS = ["role", "description", "required_skills", "certifications", "min_experience"]
+
+# alternative field names seen in posting dumps
+ROLE_FIELDS = ("role", "title", "job_title", "position")
+SKILL_FIELDS = ("required_skills", "skills", "skill_tags")
+DESCRIPTION_FIELDS = ("description", "job_description", "summary")
+CERT_FIELDS = ("certifications", "certs")
+EXPERIENCE_FIELDS = ("min_experience", "experience_years", "years_experience")
+
+
+def fetch_jobs(path: str | Path = DATA_PATH) -> pd.DataFrame:
+    df = read_roles_csv(path)
+    return df.dropna(subset=["role"]).reset_index(drop=True)
+
+
+# ---------------------------
+# Streaming readers
+# ---------------------------
+def _open_text(path: Path):
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8", errors="replace")
+    return open(path, encoding="utf-8", errors="replace")
+
+
+def _is_json_array(path: Path) -> bool:
+    with _open_text(path) as f:
+        for line in f:
+            if line.strip():
+                return line.lstrip().startswith("[")
+    return False
+
+
+def iter_posting_chunks(path: str | Path, chunksize: int = 50_000,
+                        stats: Optional[Dict[str, int]] = None) -> Iterator[List[dict]]:
+    """
+    Yield lists of raw posting dicts, at most chunksize at a time.
+    JSONL is streamed line by line; a .json file holding one JSON array is parsed whole.
+    Rows that cannot be parsed (bad JSON, non-object entries, CSV lines with the wrong
+    number of fields) are skipped and counted in stats["malformed_rows"].
+    """
+    path = Path(path)
+    stats = stats if stats is not None else {}
+    stats.setdefault("malformed_rows", 0)
+    suffixes = [s.lower() for s in path.suffixes]
+
+    def chunks(records) -> Iterator[List[dict]]:
+        chunk = []
+        for rec in records:
+            if not isinstance(rec, dict):
+                stats["malformed_rows"] += 1
+                continue
+            chunk.append(rec)
+            if len(chunk) >= chunksize:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def json_lines(f):
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                stats["malformed_rows"] += 1
+
+    if ".json" in suffixes and _is_json_array(path):
+        with _open_text(path) as f:
+            try:
+                records = json.load(f)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path} is not a valid JSON array: {e}") from e
+        yield from chunks(records)
+    elif ".jsonl" in suffixes or ".ndjson" in suffixes or ".json" in suffixes:
+        with _open_text(path) as f:
+            yield from chunks(json_lines(f))
+    elif ".csv" in suffixes:
+        def bad_line(fields):
+            stats["malformed_rows"] += 1
+            return None  # skip the line
+
+        # a callable on_bad_lines needs the python engine
+        for df in pd.read_csv(path, chunksize=chunksize, dtype=str, encoding="utf-8", encoding_errors="replace",
+                              engine="python", on_bad_lines=bad_line):
+            yield df.where(df.notna(), None).to_dict(orient="records")
+    else:
+        raise ValueError(f"Unsupported dump format: {path}")
+
+
+# ---------------------------
+# Normalization
+# ---------------------------
+def _first(raw: dict, fields) -> Optional[object]:
+    for f in fields:
+        v = raw.get(f)
+        if v is not None and v == v and v != "":  # skip None / NaN / empty
+            return v
+    return None
+
+
+def _as_list(v) -> List[str]:
+    if v is None:
+        return []
+    if isinstance(v, (list, tuple)):
+        return [normalize_skill(str(x)) for x in v if str(x).strip()]
+    return [normalize_skill(x) for x in re.split(r"[;|,]", str(v)) if x.strip()]
+
+
+# seniority / level words dropped from titles so "Sr. Data Engineer II" groups with "Data Engineer"
+_LEVEL_WORDS = {
+    "senior", "sr", "junior", "jr", "lead", "principal", "staff", "associate", "intern", "trainee",
+    "graduate", "entry-level", "mid-level", "i", "ii", "iii", "iv", "1", "2", "3",
+}
+
+
+def clean_title(title: str) -> str:
+    """
+    Strip location / company / seniority noise from a job title:
+    "Senior Python Developer (Remote) - Berlin" -> "Python Developer".
+    """
+    t = re.sub(r"[\(\[\{].*?[\)\]\}]", " ", title)                         # (Remote), [NYC]
+    t = re.split(r"\s+(?:-|–|—|\||@|at)\s+|,", t, maxsplit=1, flags=re.IGNORECASE)[0]  # - London, at Acme
+    words = t.split()
+    while words and words[0].lower().rstrip(".") in _LEVEL_WORDS:
+        words.pop(0)
+    while words and words[-1].lower().rstrip(".") in _LEVEL_WORDS:
+        words.pop()
+    return " ".join(words) or re.sub(r"\s+", " ", title).strip()
 
-DATA_PATH = Path("backend/data/it_job_roles.csv")
 
-def fetch_jobs():
-    return pd.read_csv(DATA_PATH)
+def normalize_posting(raw: dict) -> Optional[dict]:
+    """Map a raw posting onto catalog fields; None if it has no role or no skills."""
+    role = _first(raw, ROLE_FIELDS)
+    if role is None:
+        return None
+    role = clean_title(re.sub(r"\s+", " ", str(role)).strip())
+    skills = list(dict.fromkeys(_as_list(_first(raw, SKILL_FIELDS))))
+    if not role or not skills:
+        return None
+
+    exp = _first(raw, EXPERIENCE_FIELDS)
+    try:
+        exp = int(float(exp)) if exp is not None else 0
+    except (TypeError, ValueError):
+        exp = 0
+
+    return {
+        "role": role,
+        "description": re.sub(r"\s+", " ", str(_first(raw, DESCRIPTION_FIELDS) or "")).strip(),
+        "skills": skills,
+        "certifications": list(dict.fromkeys(_as_list(_first(raw, CERT_FIELDS)))),
+        "min_experience": max(0, exp),
+    }
+
+
+# ---------------------------
+# MinHash / LSH near-duplicate detection
+# ---------------------------
+_MERSENNE = np.uint64((1 << 31) - 1)
+
+
+class MinHashLSH:
+    """
+    MinHash signatures over word 3-shingles, banded LSH index.
+    With 128 permutations in 16 bands of 8 rows, postings with Jaccard similarity
+    above ~0.7 collide with high probability.
+    Band keys are scoped to a role, so only postings for the same (cleaned) title are compared:
+    a company's boilerplate description shared by different jobs does not collapse them.
+    The index keeps two generations of band-hash sets and drops the older one once the
+    newer holds window postings, so near-duplicates are caught within the last
+    window..2*window unique postings. Each indexed posting costs one Python int per band
+    (~60 bytes in a set), i.e. about bands * 2 * window * 60 B: ~100 MB at the default
+    window of 50_000 with 16 bands. Raise window for wider dedupe on sorted dumps.
+    """
+
+    def __init__(self, num_perm: int = 128, bands: int = 16, window: int = 50_000, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        rng = np.random.RandomState(seed)
+        self.a = rng.randint(1, int(_MERSENNE), size=num_perm).astype(np.uint64)
+        self.b = rng.randint(0, int(_MERSENNE), size=num_perm).astype(np.uint64)
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.window = window
+        self._current: List[set] = [set() for _ in range(bands)]
+        self._previous: List[set] = [set() for _ in range(bands)]
+        self._size = 0
+
+    @staticmethod
+    def shingles(posting: dict) -> set:
+        words = re.findall(r"[a-z0-9\+\#\.]+", f"{posting['role']} {posting['description']}".lower())
+        grams = {" ".join(words[i:i + 3]) for i in range(max(1, len(words) - 2))}
+        grams.update(f"skill:{s}" for s in posting["skills"])
+        return grams
+
+    def signature(self, shingles: set) -> np.ndarray:
+        hashes = np.fromiter(
+            (int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=4).digest(), "little") for s in shingles),
+            dtype=np.uint64,
+            count=len(shingles),
+        )
+        # (a * h + b) mod p for every permutation, min over shingles; a * h < 2**63 so uint64 does not overflow
+        return ((np.outer(self.a, hashes) + self.b[:, None]) % _MERSENNE).min(axis=1)
+
+    def _band_keys(self, sig: np.ndarray, scope: str) -> List[int]:
+        # bucket on a hash of (scope, band) rather than its bytes to keep index entries small
+        return [hash((scope, sig[i * self.rows:(i + 1) * self.rows].tobytes())) for i in range(self.bands)]
+
+    def seen_or_add(self, sig: np.ndarray, scope: str = "") -> bool:
+        """True if a near-duplicate with the same scope is already indexed, else index sig and return False."""
+        keys = self._band_keys(sig, scope)
+        for band, key in enumerate(keys):
+            if key in self._current[band] or key in self._previous[band]:
+                return True
+        if self._size >= self.window:
+            self._previous, self._current = self._current, [set() for _ in range(self.bands)]
+            self._size = 0
+        for band, key in enumerate(keys):
+            self._current[band].add(key)
+        self._size += 1
+        return False
+
+
+# ---------------------------
+# Aggregation
+# ---------------------------
+class _RoleAggregate:
+    __slots__ = ("role", "postings", "skills", "certs", "experience", "description")
+
+    def __init__(self, role: str):
+        self.role = role
+        self.postings = 0
+        self.skills = Counter()
+        self.certs = Counter()
+        self.experience = Counter()
+        self.description = ""
+
+    def add(self, p: dict, max_tracked: int):
+        self.postings += 1
+        self.skills.update(p["skills"])
+        self.certs.update(p["certifications"])
+        self.experience[p["min_experience"]] += 1
+        if not self.description and p["description"]:
+            self.description = p["description"][:500]
+        # keep per-role counters bounded
+        if len(self.skills) > 2 * max_tracked:
+            self.skills = Counter(dict(self.skills.most_common(max_tracked)))
+        if len(self.certs) > 2 * max_tracked:
+            self.certs = Counter(dict(self.certs.most_common(max_tracked)))
+
+    def to_row(self, max_skills: int, min_support: float) -> dict:
+        floor = max(1, int(min_support * self.postings))
+        ranked = self.skills.most_common(max_skills)
+        skills = [s for s, c in ranked if c >= floor] or [s for s, _ in ranked[:5]]
+        certs = [c for c, n in self.certs.most_common(5) if n >= floor]
+        # median experience over postings
+        half, seen, median = self.postings / 2, 0, 0
+        for years in sorted(self.experience):
+            seen += self.experience[years]
+            if seen >= half:
+                median = years
+                break
+        return {
+            "role": self.role,
+            "description": self.description,
+            "required_skills": ", ".join(skills),
+            "certifications": ", ".join(certs),
+            "min_experience": median,
+        }
+
+
+def _prune_roles(roles: Dict[str, _RoleAggregate], keep: int) -> int:
+    """Drop all but the keep best-supported roles in place; returns the postings dropped."""
+    ranked = sorted(roles.items(), key=lambda kv: kv[1].postings, reverse=True)
+    dropped = sum(agg.postings for _, agg in ranked[keep:])
+    for key, _ in ranked[keep:]:
+        del roles[key]
+    return dropped
+
+
+def ingest_postings(paths: List[str | Path], out_path: str | Path, chunksize: int = 50_000,
+                    max_skills: int = 20, min_support: float = 0.1, window: int = 50_000,
+                    max_tracked_skills: int = 200, max_roles: int = 50_000, min_postings: int = 1) -> dict:
+    """
+    Stream postings from paths into a compact role catalog at out_path.
+    Titles are grouped after clean_title(), and postings are only deduplicated against
+    postings of the same title. At most max_roles aggregates are held: when the
+    cap is exceeded, the least-supported half is dropped, so one-off titles cannot grow memory
+    without bound. Roles with fewer than min_postings unique postings are left out of the output.
+    Returns an ingestion report (rows, malformed rows, duplicates, dedupe ratio, pruned roles, throughput);
+    rows_read counts every row in the dumps, including malformed ones.
+    """
+    lsh = MinHashLSH(window=window)
+    roles: Dict[str, _RoleAggregate] = {}
+    rows = valid = duplicates = 0
+    stats = {"malformed_rows": 0}
+    pruned_roles = pruned_postings = 0
+    t0 = time.perf_counter()
+
+    for path in paths:
+        for chunk in iter_posting_chunks(path, chunksize=chunksize, stats=stats):
+            for raw in chunk:
+                rows += 1
+                p = normalize_posting(raw)
+                if p is None:
+                    continue
+                valid += 1
+                key = p["role"].lower()
+                if lsh.seen_or_add(lsh.signature(lsh.shingles(p)), scope=key):
+                    duplicates += 1
+                    continue
+                agg = roles.get(key)
+                if agg is None:
+                    if len(roles) >= max_roles:
+                        before = len(roles)
+                        pruned_postings += _prune_roles(roles, max_roles // 2)
+                        pruned_roles += before - len(roles)
+                    agg = roles[key] = _RoleAggregate(p["role"])
+                agg.add(p, max_tracked_skills)
+
+    catalog = pd.DataFrame(
+        [agg.to_row(max_skills, min_support) for agg in roles.values() if agg.postings >= min_postings],
+        columns=CATALOG_COLUMNS,
+    ).sort_values("role")
+    # UTF-8 keeps non-Latin titles distinct; catalog.read_roles_csv reads it back
+    catalog.to_csv(out_path, index=False, encoding="utf-8")
+
+    elapsed = time.perf_counter() - t0
+    rows += stats["malformed_rows"]
+    report = {
+        "rows_read": rows,
+        "malformed_rows": stats["malformed_rows"],
+        "incomplete_postings": rows - stats["malformed_rows"] - valid,  # no role or no skills
+        "valid_postings": valid,
+        "duplicates": duplicates,
+        "dedupe_ratio": round(duplicates / valid, 4) if valid else 0.0,
+        "roles": len(catalog),
+        "pruned_roles": pruned_roles,
+        "pruned_postings": pruned_postings,
+        "elapsed_s": round(elapsed, 2),
+        "rows_per_s": round(rows / elapsed, 1) if elapsed else 0.0,
+        "output": str(out_path),
+    }
+    try:
+        import resource
+        report["peak_rss_mb"] = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+    except ImportError:  # not available on Windows
+        pass
+    return report
+
+
+def check_role_scoped_dedupe() -> None:
+    """
+    Regression check: two different jobs sharing a company's boilerplate description
+    (shingle Jaccard ~0.76) must both be kept, while a repeat of either is a duplicate.
+    """
+    boilerplate = ("Acme Corp is a global leader in digital transformation. We value diversity, offer flexible "
+                   "remote work, competitive salary, health insurance, a learning budget and a friendly team "
+                   "culture. Join us to build products used by millions of customers around the world.")
+    first = normalize_posting({"title": "Data Scientist", "description": boilerplate,
+                               "skills": "python, sql, machine learning, statistics"})
+    second = normalize_posting({"title": "Network Administrator", "description": boilerplate,
+                                "skills": "cisco, tcp/ip, firewalls, routing"})
+    lsh = MinHashLSH()
+    for p in (first, second):
+        assert not lsh.seen_or_add(lsh.signature(lsh.shingles(p)), scope=p["role"].lower()), \
+            f"{p['role']} was collapsed into a different role"
+    assert lsh.seen_or_add(lsh.signature(lsh.shingles(second)), scope=second["role"].lower()), \
+        "a repeated posting was not detected"
+
 
 if __name__ == "__main__":
-    print(fetch_jobs().head())
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Ingest job-posting dumps into a role catalog")
+    parser.add_argument("inputs", nargs="*", help="JSONL/CSV dumps (optionally .gz)")
+    parser.add_argument("--check", action="store_true", help="run the near-duplicate regression check and exit")
+    parser.add_argument("--out", default=str(DATA_PATH.with_name("it_job_roles_ingested.csv")))
+    parser.add_argument("--chunksize", type=int, default=50_000)
+    parser.add_argument("--max-skills", type=int, default=20)
+    parser.add_argument("--min-support", type=float, default=0.1,
+                        help="keep skills listed in at least this share of a role's postings")
+    parser.add_argument("--window", type=int, default=50_000,
+                        help="unique postings per LSH generation; ~bands*2*window*60 bytes (~100 MB at 50k)")
+    parser.add_argument("--max-roles", type=int, default=50_000,
+                        help="role aggregates held in memory before the least-supported half is dropped")
+    parser.add_argument("--min-postings", type=int, default=1,
+                        help="leave out roles with fewer unique postings than this")
+    args = parser.parse_args()
+
+    if args.check:
+        check_role_scoped_dedupe()
+        print("near-duplicate check passed")
+    elif not args.inputs:
+        print(fetch_jobs().head())
+    else:
+        print(json.dumps(ingest_postings(args.inputs, args.out, chunksize=args.chunksize, max_skills=args.max_skills,
+                                         min_support=args.min_support, window=args.window,
+                                         max_roles=args.max_roles, min_postings=args.min_postings), indent=2))
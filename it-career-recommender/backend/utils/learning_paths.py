@@ -1,4 +1,5 @@
 import pandas as pd
+from functools import lru_cache
 from pathlib import Path
 from rapidfuzz import process, fuzz
 
@@ -28,7 +29,11 @@ def normalize_skill(s: str) -> str:
     return ALIASES.get(s, s)
 
 
+@lru_cache(maxsize=1)
 def load_courses():
+    """
+    Courses catalog, read once per process and shared by every request; callers must not modify it.
+    """
     df = pd.read_csv(COURSES, encoding="utf-8")
     df["skill"] = df["skill"].apply(normalize_skill)
     return df
@@ -79,11 +84,49 @@ def build_learning_plan(missing_skills):
     return recommend_courses(missing_skills)
 
 
-def build_career_roadmap(top_role: str):
+def learning_plan_for(rec: dict, courses_map: dict) -> list:
+    """
+    Learning-plan entries for a recommendation's missing skills, from a build_learning_plan() result.
     """
-    Placeholder for career roadmap generation.
-    Extend with custom logic if needed.
+    lp = []
+    for ms in rec.get("missing_skills", []):
+        if ms in courses_map:
+            for c in courses_map[ms]:
+                lp.append({
+                    "skill": ms,
+                    "steps": [c.get("course_title")],
+                    "project_idea": f"Build a small project using {ms}",
+                    "estimated_hours": c.get("duration_hours", 0),
+                    "platform": c.get("platform", "")
+                })
+    return lp
+
+
+def build_career_roadmap(top_role: str, target_role: str | None = None, graph=None, from_row: int | None = None):
     """
+    Career roadmap from the candidate's best-fit role.
+    With a role graph (utils.role_graph.RoleGraph) and a target role, the roadmap is the
+    cheapest chain of role transitions, starting from catalog row from_row when known;
+    otherwise a generic four-step plan for top_role.
+    """
+    if graph is not None and target_role:
+        hops = graph.transition_path(top_role, target_role, from_row=from_row)
+        if hops:
+            steps = []
+            for i, hop in enumerate(hops, start=1):
+                step = {
+                    "step": i,
+                    "goal": f"Move from {hop['from']} to {hop['to']}",
+                    "role": hop["to"],
+                    "new_skills": hop["new_skills"],
+                }
+                if "estimated_hours" in hop:
+                    step["estimated_hours"] = hop["estimated_hours"]
+                steps.append(step)
+            # the graph's spelling of the target, not the client's
+            steps.append({"step": len(steps) + 1, "goal": f"Apply for {hops[-1]['to']} roles"})
+            return steps
+
     return [
         {"step": 1, "goal": f"Master fundamentals required for {top_role}"},
         {"step": 2, "goal": f"Complete 2–3 projects aligned with {top_role}"},
@@ -0,0 +1,383 @@
+# utils/loadtest.py
+"""
+Self-contained load test for the API.
+
+Boots the FastAPI app in-process against an in-memory MongoDB stand-in and a stubbed
+Google token verifier, then drives mixed traffic from an async client:
+/api/analyze (PDF/DOCX/TXT uploads), /api/hr/analyze-best, signup/login/google-login/dashboard.
+Reports latency percentiles, error rates, throughput and event-loop lag per concurrency level.
+
+Run from the it-career-recommender directory:
+    python -m backend.utils.loadtest --concurrency 1,8,32 --duration 30
+    python -m backend.utils.loadtest --base-url http://localhost:8000   # against a running server
+"""
+import argparse
+import asyncio
+import csv
+import io
+import itertools
+import json
+import random
+import time
+import uuid
+from collections import defaultdict
+from pathlib import Path
+from types import SimpleNamespace
+
+import httpx
+from bson import ObjectId
+from pymongo.errors import DuplicateKeyError
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+ROLES_CSV = BASE_DIR / "data" / "it_job_roles.csv"
+RESUMES_CSV = BASE_DIR / "data" / "test_resumes.csv"
+
+# share of requests per operation
+DEFAULT_MIX = {
+    "analyze": 0.45,
+    "hr_analyze_best": 0.10,
+    "signup": 0.10,
+    "login": 0.15,
+    "google_login": 0.05,
+    "dashboard": 0.15,
+}
+
+
+# ---------------------------
+# MongoDB stand-in
+# ---------------------------
+class _Cursor:
+    def __init__(self, docs):
+        self._docs = iter(docs)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._docs)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class InMemoryCollection:
+    """The subset of the motor collection API used by utils.db / utils.auth."""
+
+    def __init__(self):
+        self._docs = {}
+        self._unique = set()
+
+    @staticmethod
+    def _matches(doc, flt):
+        return all(doc.get(k) == v for k, v in (flt or {}).items())
+
+    async def create_index(self, field, unique=False):
+        if unique:
+            self._unique.add(field)
+        return field
+
+    async def insert_one(self, doc):
+        for field in self._unique:
+            if field in doc and any(d.get(field) == doc[field] for d in self._docs.values()):
+                raise DuplicateKeyError(f"duplicate key: {field}={doc[field]!r}")
+        doc = {**doc, "_id": doc.get("_id", ObjectId())}
+        self._docs[doc["_id"]] = doc
+        return SimpleNamespace(inserted_id=doc["_id"])
+
+    async def find_one(self, flt):
+        if "_id" in flt and len(flt) == 1:
+            doc = self._docs.get(flt["_id"])
+            return dict(doc) if doc else None
+        for doc in self._docs.values():
+            if self._matches(doc, flt):
+                return dict(doc)
+        return None
+
+    async def update_one(self, flt, update):
+        for doc in self._docs.values():
+            if self._matches(doc, flt):
+                doc.update(update.get("$set", {}))
+                return SimpleNamespace(matched_count=1, modified_count=1)
+        return SimpleNamespace(matched_count=0, modified_count=0)
+
+    def find(self, flt=None):
+        return _Cursor([dict(d) for d in self._docs.values() if self._matches(d, flt)])
+
+
+async def _fake_verify_google_id_token(id_tok: str):
+    # tokens look like "fake:<email>"
+    email = id_tok.split(":", 1)[-1]
+    return {"email": email, "name": email.split("@")[0], "aud": "loadtest"}
+
+
+def install_stand_ins():
+    """Swap the Mongo collections and the Google verifier before the app handles requests."""
+    from . import auth, db
+
+    users, selections = InMemoryCollection(), InMemoryCollection()
+    db.users, db.selections = users, selections
+    auth.users, auth.selections = users, selections
+    auth.verify_google_id_token = _fake_verify_google_id_token
+
+
+# ---------------------------
+# Payloads
+# ---------------------------
+def _pdf_escape(s: str) -> str:
+    return s.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def make_pdf(text: str) -> bytes:
+    """Minimal single-page PDF with extractable text."""
+    body = " ".join(f"({_pdf_escape(line)}) Tj T*" for line in text.splitlines() or [""])
+    stream = f"BT /F1 11 Tf 50 780 Td 14 TL {body} ET"
+    objs = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        "<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R "
+        "/Resources << /Font << /F1 5 0 R >> >> >>",
+        f"<< /Length {len(stream.encode('latin-1', 'replace'))} >>\nstream\n{stream}\nendstream",
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for i, obj in enumerate(objs, start=1):
+        offsets.append(len(out))
+        out += f"{i} 0 obj\n{obj}\nendobj\n".encode("latin-1", "replace")
+    xref = len(out)
+    out += f"xref\n0 {len(objs) + 1}\n0000000000 65535 f \n".encode()
+    for off in offsets:
+        out += f"{off:010d} 00000 n \n".encode()
+    out += f"trailer\n<< /Size {len(objs) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    return out
+
+
+def make_docx(text: str) -> bytes:
+    import docx
+
+    doc = docx.Document()
+    for line in text.splitlines():
+        doc.add_paragraph(line)
+    buf = io.BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+
+def build_uploads(limit: int = 20):
+    """[(filename, bytes, content_type)] cycling through TXT, PDF and DOCX versions of the test resumes."""
+    with open(RESUMES_CSV, encoding="utf-8") as f:
+        texts = [row["resume_text"] for row in csv.DictReader(f)][:limit]
+    uploads = []
+    for i, text in enumerate(texts):
+        text = f"{text}\n{2 + i % 8} years of experience"
+        uploads.append((f"resume_{i}.txt", text.encode("utf-8"), "text/plain"))
+        uploads.append((f"resume_{i}.pdf", make_pdf(text), "application/pdf"))
+        uploads.append((
+            f"resume_{i}.docx",
+            make_docx(text),
+            "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        ))
+    return uploads
+
+
+def load_role_names(limit: int = 50):
+    with open(ROLES_CSV, encoding="latin1") as f:
+        return [row["role"] for row in csv.DictReader(f) if row.get("role")][:limit]
+
+
+# ---------------------------
+# Traffic
+# ---------------------------
+class Traffic:
+    def __init__(self, client: httpx.AsyncClient, mix: dict, seed: int = 0):
+        self.client = client
+        self.ops = list(mix)
+        self.weights = [mix[o] for o in self.ops]
+        self.rng = random.Random(seed)
+        self.uploads = build_uploads()
+        self.roles = load_role_names()
+        self.accounts = []  # (email, password, token)
+        self._upload_iter = itertools.cycle(self.uploads)
+
+    async def _signup(self):
+        email = f"load-{uuid.uuid4().hex[:12]}@example.com"
+        r = await self.client.post("/api/signup", json={"name": "Load Test", "email": email, "password": "pw-123456"})
+        if r.status_code == 200:
+            self.accounts.append((email, "pw-123456", r.json()["token"]))
+        return r
+
+    async def run_one(self, op: str) -> httpx.Response:
+        # login / dashboard need an account; create one first if none exist yet
+        if op in ("login", "dashboard") and not self.accounts:
+            op = "signup"
+        if op == "signup":
+            return await self._signup()
+        if op == "login":
+            email, password, _ = self.rng.choice(self.accounts)
+            return await self.client.post("/api/login", json={"email": email, "password": password})
+        if op == "dashboard":
+            _, _, token = self.rng.choice(self.accounts)
+            return await self.client.get("/api/dashboard", headers={"Authorization": f"Bearer {token}"})
+        if op == "google_login":
+            email = f"google-{self.rng.randrange(1000)}@example.com"
+            return await self.client.post("/api/google-login", params={"id_token": f"fake:{email}"})
+        if op == "analyze":
+            name, data, ctype = next(self._upload_iter)
+            return await self.client.post("/api/analyze", files={"file": (name, data, ctype)})
+        if op == "hr_analyze_best":
+            picks = self.rng.sample(self.uploads, k=min(3, len(self.uploads)))
+            files = [("files", (name, data, ctype)) for name, data, ctype in picks]
+            return await self.client.post("/api/hr/analyze-best", data={"job_role": self.rng.choice(self.roles)}, files=files)
+        raise ValueError(f"unknown op {op}")
+
+    def pick(self) -> str:
+        return self.rng.choices(self.ops, weights=self.weights)[0]
+
+
+async def _monitor_loop_lag(samples: list, stop: asyncio.Event, interval: float = 0.01):
+    """Record how late the event loop wakes a sleeping task (in-process runs only)."""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        t0 = loop.time()
+        await asyncio.sleep(interval)
+        samples.append(max(0.0, loop.time() - t0 - interval))
+
+
+def percentile(values, q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, max(0, round(q / 100 * len(ordered)) - 1))
+    return ordered[idx]
+
+
+def _summarize(latencies, errors, elapsed, lag):
+    def ms(v):
+        return round(v * 1000, 2)
+
+    report = {"elapsed_s": round(elapsed, 2), "endpoints": {}}
+    total = total_err = 0
+    for op, lats in sorted(latencies.items()):
+        n = len(lats)
+        total += n
+        total_err += errors[op]
+        report["endpoints"][op] = {
+            "requests": n,
+            "error_rate": round(errors[op] / n, 4) if n else 0.0,
+            "p50_ms": ms(percentile(lats, 50)),
+            "p90_ms": ms(percentile(lats, 90)),
+            "p99_ms": ms(percentile(lats, 99)),
+            "max_ms": ms(max(lats)) if lats else 0.0,
+        }
+    all_lats = [v for lats in latencies.values() for v in lats]
+    report["overall"] = {
+        "requests": total,
+        "throughput_rps": round(total / elapsed, 2) if elapsed else 0.0,
+        "error_rate": round(total_err / total, 4) if total else 0.0,
+        "p50_ms": ms(percentile(all_lats, 50)),
+        "p99_ms": ms(percentile(all_lats, 99)),
+    }
+    if lag:
+        report["event_loop_lag"] = {
+            "p50_ms": ms(percentile(lag, 50)),
+            "p99_ms": ms(percentile(lag, 99)),
+            "max_ms": ms(max(lag)),
+        }
+    return report
+
+
+async def run_level(traffic: Traffic, concurrency: int, duration: float, measure_lag: bool):
+    latencies = defaultdict(list)
+    errors = defaultdict(int)
+    lag = []
+    stop = asyncio.Event()
+    deadline = time.perf_counter() + duration
+
+    async def worker():
+        while time.perf_counter() < deadline:
+            op = traffic.pick()
+            t0 = time.perf_counter()
+            try:
+                r = await traffic.run_one(op)
+                failed = r.status_code >= 400 or (r.headers.get("content-type", "").startswith("application/json")
+                                                  and isinstance(r.json(), dict) and "error" in r.json())
+            except Exception:
+                failed = True
+            latencies[op].append(time.perf_counter() - t0)
+            if failed:
+                errors[op] += 1
+
+    monitor = asyncio.create_task(_monitor_loop_lag(lag, stop)) if measure_lag else None
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    if monitor:
+        await monitor
+    return _summarize(latencies, errors, elapsed, lag)
+
+
+def print_report(concurrency: int, report: dict):
+    print(f"\n=== concurrency {concurrency} ({report['elapsed_s']}s) ===")
+    print(f"{'endpoint':<18}{'reqs':>7}{'err%':>8}{'p50ms':>10}{'p90ms':>10}{'p99ms':>10}{'maxms':>10}")
+    for op, s in report["endpoints"].items():
+        print(f"{op:<18}{s['requests']:>7}{s['error_rate'] * 100:>8.2f}{s['p50_ms']:>10}{s['p90_ms']:>10}"
+              f"{s['p99_ms']:>10}{s['max_ms']:>10}")
+    o = report["overall"]
+    print(f"overall: {o['requests']} reqs, {o['throughput_rps']} req/s, errors {o['error_rate'] * 100:.2f}%, "
+          f"p50 {o['p50_ms']}ms, p99 {o['p99_ms']}ms")
+    if "event_loop_lag" in report:
+        lag = report["event_loop_lag"]
+        print(f"event-loop lag: p50 {lag['p50_ms']}ms, p99 {lag['p99_ms']}ms, max {lag['max_ms']}ms")
+
+
+async def main(args):
+    levels = [int(c) for c in args.concurrency.split(",")]
+    mix = json.loads(args.mix) if args.mix else DEFAULT_MIX
+    results = {}
+
+    if args.base_url:
+        async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout) as client:
+            traffic = Traffic(client, mix, seed=args.seed)
+            for c in levels:
+                results[c] = await run_level(traffic, c, args.duration, measure_lag=False)
+                print_report(c, results[c])
+    else:
+        install_stand_ins()
+        from ..app import app
+
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=args.timeout) as client:
+                traffic = Traffic(client, mix, seed=args.seed)
+                for c in levels:
+                    results[c] = await run_level(traffic, c, args.duration, measure_lag=True)
+                    print_report(c, results[c])
+
+    # highest throughput whose p99 and error rate stay within the SLO
+    ok = [(r["overall"]["throughput_rps"], c) for c, r in results.items()
+          if r["overall"]["p99_ms"] <= args.slo_p99_ms and r["overall"]["error_rate"] <= args.max_error_rate]
+    if ok:
+        rps, c = max(ok)
+        print(f"\nmax sustainable throughput: {rps} req/s at concurrency {c} "
+              f"(p99 <= {args.slo_p99_ms}ms, errors <= {args.max_error_rate * 100:.1f}%)")
+    else:
+        print("\nno concurrency level met the SLO")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({str(c): r for c, r in results.items()}, f, indent=2)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test the resume analyzer API")
+    parser.add_argument("--concurrency", default="1,8,32", help="comma-separated concurrency levels")
+    parser.add_argument("--duration", type=float, default=20.0, help="seconds per concurrency level")
+    parser.add_argument("--base-url", default="", help="target a running server instead of the in-process app")
+    parser.add_argument("--mix", default="", help='JSON op weights, e.g. \'{"analyze": 1}\'')
+    parser.add_argument("--slo-p99-ms", type=float, default=2000.0)
+    parser.add_argument("--max-error-rate", type=float, default=0.01)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", default="", help="write the full report to this file")
+    asyncio.run(main(parser.parse_args()))
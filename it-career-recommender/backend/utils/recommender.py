@@ -2,8 +2,10 @@ from typing import List, Dict, Any
 import os
 import pandas as pd
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
-from .embeddings import Embedder
+import threading
+from .artifacts import load_artifacts
+from .catalog import RoleCatalog
+from .embeddings import Embedder, DEFAULT_MODEL
 from .skill_extractor import extract_skills_from_text   # <-- use skill extractor!
 
 
@@ -20,21 +22,37 @@ def split_skills(s: str) -> List[str]:
 
 
 class RoleRecommender:
-    def __init__(self, dataset_path: str):
-        self.roles_df = pd.read_csv(dataset_path, encoding="latin1")
-
-        if "role" not in self.roles_df.columns or "required_skills" not in self.roles_df.columns:
-            raise ValueError("Dataset must have columns: role, required_skills")
-
-        self.roles_df["skills_list"] = self.roles_df["required_skills"].apply(split_skills)
-        if "min_experience" not in self.roles_df.columns:
-            self.roles_df["min_experience"] = 0
-
-        self.embedder = Embedder()
-
-        self.roles_df["vec"] = self.roles_df["skills_list"].apply(
-            lambda skills: self.embedder.encode_mean(skills if skills else [""])
-        )
+    def __init__(self, dataset_path: str, model_name: str = DEFAULT_MODEL, use_artifacts: bool = True):
+        # the model is only needed to embed resumes, so it is loaded on first use
+        self.model_name = model_name
+        self._embedder = None
+        self._embedder_lock = threading.Lock()
+
+        # role embeddings and skills: memory-mapped from prebuilt artifacts when available
+        # (shared through the page cache by every worker), else parsed and embedded here
+        self.artifacts = load_artifacts(dataset_path, model_name) if use_artifacts else None
+        if self.artifacts is not None:
+            self.catalog = RoleCatalog.from_artifacts(dataset_path, self.artifacts)
+        else:
+            self.catalog = RoleCatalog.from_csv(dataset_path)
+            self.catalog.embeddings = np.empty(
+                (len(self.catalog), self.embedder.model.get_sentence_embedding_dimension()), dtype=np.float32
+            )
+            for i in range(len(self.catalog)):
+                skills = self.catalog.skills(i)
+                self.catalog.embeddings[i] = self.embedder.encode_mean(skills if skills else [""])[0]
+
+        self.role_matrix = self.catalog.embeddings
+        self.role_norms = np.linalg.norm(self.role_matrix, axis=1)
+        self.role_norms[self.role_norms == 0] = 1.0
+
+    @property
+    def embedder(self) -> Embedder:
+        if self._embedder is None:
+            with self._embedder_lock:
+                if self._embedder is None:
+                    self._embedder = Embedder(self.model_name)
+        return self._embedder
 
     def _resume_vector(self, skills: List[str]) -> np.ndarray:
         skills = [normalize_skill(s) for s in skills if s]
@@ -43,36 +61,36 @@ class RoleRecommender:
         return self.embedder.encode_mean(skills)
 
     def recommend_roles(self, skills: List[str], experience_years: int, top_k: int = 5) -> List[Dict[str, Any]]:
-        rvec = self._resume_vector(skills)
-        role_vecs = np.vstack(self.roles_df["vec"].values.tolist())
-        sims = cosine_similarity(rvec, role_vecs).flatten()
-
-        candidates = self.roles_df.copy()
-        candidates["similarity"] = sims
+        rvec = self._resume_vector(skills)[0]
+        # cosine similarity against the (possibly memory-mapped) role matrix without copying it
+        sims = (self.role_matrix @ rvec) / (self.role_norms * (np.linalg.norm(rvec) or 1.0))
 
-        def exp_penalty(row):
-            minexp = int(row.get("min_experience", 0) or 0)
-            if experience_years >= minexp:
-                return 1.0
-            gap = max(0, minexp - experience_years)
-            return max(0.6, 1.0 - 0.1 * gap)
+        # experience penalty: 1.0 when experienced enough, else -0.1 per missing year, floored at 0.6
+        gap = np.maximum(0, self.catalog.min_experience.astype(np.int32) - experience_years)
+        scores = sims * np.where(gap == 0, 1.0, np.maximum(0.6, 1.0 - 0.1 * gap))
+        scores[~self.catalog.valid] = -np.inf
 
-        candidates["score"] = candidates.apply(lambda r: r["similarity"] * exp_penalty(r), axis=1)
-        candidates = candidates.sort_values("score", ascending=False).head(top_k)
+        top_k = min(top_k, int(self.catalog.valid.sum()))
+        if top_k <= 0:
+            return []
+        top = np.argpartition(-scores, top_k - 1)[:top_k]
+        top = top[np.argsort(-scores[top], kind="stable")]
 
         out = []
-        skill_set = set([normalize_skill(s) for s in skills])
-        for _, row in candidates.iterrows():
-            role_skills = set(row["skills_list"])
-            missing = sorted(list(role_skills - skill_set))
+        # vocabulary ids are assigned in sorted order, so sorted ids give sorted skill names
+        skill_ids = self.catalog.skill_ids_for(normalize_skill(s) for s in skills)
+        vocab = self.catalog.skill_vocab
+        for i in top:
+            role_ids = self.catalog.skill_id_slice(i).tolist()
             out.append({
-                "role": row["role"],
-                "score": float(row["score"]),
-                "similarity": float(row["similarity"]),
-                "min_experience": int(row.get("min_experience", 0) or 0),
-                "required_skills": sorted(list(role_skills)),
-                "missing_skills": missing,
-                "matched_skills": sorted(list(role_skills & skill_set))
+                "role": self.catalog.name(i),
+                "role_id": int(i),
+                "score": float(scores[i]),
+                "similarity": float(sims[i]),
+                "min_experience": int(self.catalog.min_experience[i]),
+                "required_skills": [vocab[s] for s in role_ids],
+                "missing_skills": [vocab[s] for s in role_ids if s not in skill_ids],
+                "matched_skills": [vocab[s] for s in role_ids if s in skill_ids]
             })
         return out
 
@@ -90,11 +108,11 @@ class RoleRecommender:
         Returns: {"best_resume": {...}}
         """
         # Find job role row
-        row = self.roles_df[self.roles_df["role"].str.lower() == job_role.lower()]
-        if row.empty:
+        i = self.catalog.find(job_role)
+        if i is None:
             raise ValueError(f"Job role '{job_role}' not found in dataset")
 
-        required_skills = set(row.iloc[0]["skills_list"])
+        required_skills = set(self.catalog.skills(i))
         best_resume = None
         best_score = -1
 
@@ -0,0 +1,188 @@
+# utils/response_format.py
+"""
+Compact /api/analyze response format and fast JSON encoding.
+
+The default response repeats every course under each recommendation that misses the
+skill. The compact format lists skills and courses once and has recommendations
+refer to them by index:
+    {
+      "format": "compact",
+      "extracted": {"estimated_experience_years": 3, "resume_text": "..." (optional)},
+      "skills": ["aws", "docker", ...],
+      "courses": [{"skill": 0, "title": "...", "platform": "...", "estimated_hours": 20}, ...],
+      "recommendations": [{"role": "...", "role_id": 12, "score": 0.8, "similarity": 0.8, "min_experience": 0,
+                           "required_skills": [0, 1], "matched_skills": [0], "missing_skills": [1],
+                           "learning_plan": [3]}, ...],
+      "roadmap": [...]
+    }
+role_id (the catalog row, since role names repeat) is passed through when the recommender sets it.
+A learning-plan entry's project idea is "Build a small project using <skill>", as in the full format.
+
+Benchmark both formats with:
+    python -m backend.utils.response_format
+"""
+import json
+import math
+from typing import Any, Dict, List
+
+from fastapi.responses import Response
+
+try:
+    import orjson
+except ImportError:  # optional, falls back to the stdlib encoder
+    orjson = None
+
+
+def _default(o):
+    # numpy scalars coming out of pandas
+    if hasattr(o, "item"):
+        return _finite(o.item())
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+def _finite(o):
+    """Replace NaN / Infinity with None, as orjson encodes them (null)."""
+    if isinstance(o, float):
+        return o if math.isfinite(o) else None
+    if isinstance(o, dict):
+        return {k: _finite(v) for k, v in o.items()}
+    if isinstance(o, (list, tuple)):
+        return [_finite(v) for v in o]
+    return o
+
+
+def dumps(content: Any) -> bytes:
+    # non-finite numbers (e.g. a missing duration_hours read by pandas) become null with either encoder
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(_finite(content), default=_default, ensure_ascii=False, allow_nan=False,
+                      separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(Response):
+    """JSONResponse using orjson when installed, without FastAPI's jsonable_encoder pass."""
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def build_compact_response(resume_text: str, experience: int, recs: List[Dict[str, Any]],
+                           courses_map: Dict[str, List[dict]], roadmap: list,
+                           include_text: bool = True) -> Dict[str, Any]:
+    skills: List[str] = []
+    skill_ids: Dict[str, int] = {}
+    courses: List[dict] = []
+    skill_courses: Dict[str, List[int]] = {}
+
+    def sid(skill: str) -> int:
+        i = skill_ids.get(skill)
+        if i is None:
+            i = skill_ids[skill] = len(skills)
+            skills.append(skill)
+        return i
+
+    def course_ids(skill: str) -> List[int]:
+        ids = skill_courses.get(skill)
+        if ids is None:
+            ids = skill_courses[skill] = []
+            for c in courses_map.get(skill, []):
+                ids.append(len(courses))
+                courses.append({
+                    "skill": sid(skill),
+                    "title": c.get("course_title"),
+                    "platform": c.get("platform", ""),
+                    "estimated_hours": c.get("duration_hours", 0),
+                })
+        return ids
+
+    out_recs = []
+    for r in recs:
+        missing = r.get("missing_skills", [])
+        out = {"role": r["role"]}
+        if "role_id" in r:
+            out["role_id"] = r["role_id"]
+        out.update({
+            "score": r["score"],
+            "similarity": r["similarity"],
+            "min_experience": r["min_experience"],
+            "required_skills": [sid(s) for s in r.get("required_skills", [])],
+            "matched_skills": [sid(s) for s in r.get("matched_skills", [])],
+            "missing_skills": [sid(s) for s in missing],
+            "learning_plan": [cid for s in missing for cid in course_ids(s)],
+        })
+        out_recs.append(out)
+
+    extracted = {"estimated_experience_years": experience}
+    if include_text:
+        extracted["resume_text"] = resume_text[:3000]
+    return {
+        "format": "compact",
+        "extracted": extracted,
+        "skills": skills,
+        "courses": courses,
+        "recommendations": out_recs,
+        "roadmap": roadmap,
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+    from pathlib import Path
+
+    from fastapi.encoders import jsonable_encoder
+
+    from .learning_paths import build_career_roadmap, build_learning_plan, learning_plan_for
+    from .catalog import read_roles_csv
+    from .recommender import split_skills
+
+    parser = argparse.ArgumentParser(description="Compare full vs compact /api/analyze payloads")
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    # synthetic analysis: first top_k roles, candidate knows the first two skills of each
+    roles = read_roles_csv(Path(__file__).resolve().parent.parent / "data" / "it_job_roles.csv")
+    roles = roles.dropna(subset=["role"]).head(args.top_k)
+    recs = []
+    for _, row in roles.iterrows():
+        req = sorted(set(split_skills(row["required_skills"])))
+        recs.append({
+            "role": row["role"], "score": 0.8, "similarity": 0.8, "min_experience": 0,
+            "required_skills": req, "matched_skills": req[:2], "missing_skills": req[2:],
+        })
+    courses_map = build_learning_plan(sorted({s for r in recs for s in r["missing_skills"]}))
+    roadmap = build_career_roadmap(recs[0]["role"])
+    resume_text = "Python developer with 3 years of experience in Django, REST APIs and PostgreSQL. " * 60
+
+    full = {
+        "extracted": {"resume_text": resume_text[:3000], "estimated_experience_years": 3},
+        "recommendations": [{**r, "learning_plan": learning_plan_for(r, courses_map)} for r in recs],
+        "roadmap": roadmap,
+    }
+
+    def encode_full():
+        # what FastAPI's default JSONResponse does
+        return json.dumps(jsonable_encoder(full), ensure_ascii=False, allow_nan=False,
+                          indent=None, separators=(",", ":")).encode("utf-8")
+
+    def bench(fn):
+        t0 = time.perf_counter()
+        for _ in range(args.iterations):
+            body = fn()
+        return len(body), (time.perf_counter() - t0) / args.iterations * 1e6
+
+    # "full + fast encoder" isolates the encoder speedup from the deduplication saving
+    cases = [
+        ("full (default encoder)", encode_full),
+        ("full + fast encoder", lambda: dumps(full)),
+        ("compact + text", lambda: dumps(build_compact_response(resume_text, 3, recs, courses_map, roadmap))),
+        ("compact, no text", lambda: dumps(
+            build_compact_response(resume_text, 3, recs, courses_map, roadmap, include_text=False))),
+    ]
+    print(f"encoder: {'orjson' if orjson else 'json (orjson not installed)'}, top_k={args.top_k}")
+    print(f"{'format':<26}{'bytes':>10}{'build+encode us':>18}")
+    for name, fn in cases:
+        size, us = bench(fn)
+        print(f"{name:<26}{size:>10}{us:>18.1f}")
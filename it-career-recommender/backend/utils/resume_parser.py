@@ -11,9 +11,8 @@ def extract_text(filename: str, contents: bytes) -> str:
             text += page.extract_text() or ""
     elif filename.endswith(".docx"):
         import io
-        with open("temp.docx", "wb") as f:
-            f.write(contents)
-        doc = docx.Document("temp.docx")
+        # parse in memory: concurrent uploads must not share a temp file
+        doc = docx.Document(io.BytesIO(contents))
         text = "\n".join([p.text for p in doc.paragraphs])
     else:  # fallback for .txt
         text = contents.decode("utf-8", errors="ignore")
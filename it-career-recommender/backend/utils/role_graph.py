@@ -0,0 +1,270 @@
+# utils/role_graph.py
+"""
+Offline role-similarity graph used for career-transition roadmaps.
+
+Nodes are catalog rows (aligned with RoleCatalog / the artifact role matrix), so a
+path starts from the exact row the recommender ranked even when role names repeat.
+Each role is linked to its k nearest neighbours in embedding space (in both
+directions). Moving from role A to role B costs the skills B needs that A does
+not have, counted either as a number of skills or as estimated learning hours
+from the courses catalog. The graph is stored as CSR arrays (.npy) and
+memory-mapped at load time, so a roadmap is a single Dijkstra query.
+Graphs live under data/role_graph/v<GRAPH_FORMAT_VERSION>-<fingerprint>/, using the same
+dataset/model fingerprint as utils.artifacts, so a changed catalog never serves a stale graph.
+
+Build it with:
+    python -m backend.utils.role_graph --k 10 --cost hours
+"""
+import heapq
+import json
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .artifacts import fingerprint
+from .embeddings import DEFAULT_MODEL
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+GRAPH_ROOT = BASE_DIR / "data" / "role_graph"
+
+GRAPH_FORMAT_VERSION = 2
+
+DEFAULT_HOURS_PER_SKILL = 20.0
+
+
+def graph_dir(dataset_path: str | Path, model_name: str = DEFAULT_MODEL, root: Path = GRAPH_ROOT) -> Path:
+    return Path(root) / f"v{GRAPH_FORMAT_VERSION}-{fingerprint(dataset_path, model_name)}"
+
+
+def skill_hours(skills) -> Dict[str, float]:
+    """
+    Estimated learning hours per skill: the shortest matching course in the catalog,
+    DEFAULT_HOURS_PER_SKILL when no course covers the skill.
+    """
+    from .learning_paths import load_courses, normalize_skill
+
+    df = load_courses()
+    hours = df.groupby("skill")["duration_hours"].min().to_dict()
+    return {s: float(hours.get(normalize_skill(s), DEFAULT_HOURS_PER_SKILL)) for s in skills}
+
+
+class RoleGraph:
+    def __init__(self, names: List[str], indptr, indices, weights,
+                 skill_vocab: List[str], skill_indptr, skill_indices, meta: Optional[dict] = None):
+        self.names = list(names)
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        self.skill_vocab = list(skill_vocab)
+        self.skill_indptr = skill_indptr
+        self.skill_indices = skill_indices
+        self.meta = meta or {}
+        # name lookups resolve to the first row with that name, as RoleCatalog.find does
+        self._index = {}
+        for i, n in enumerate(self.names):
+            if n:
+                self._index.setdefault(n.lower(), i)
+        self._hours = None
+
+    # ---------------------------
+    # Build / persist
+    # ---------------------------
+    @classmethod
+    def build(cls, names: List[str], skills_lists: List[List[str]], matrix: np.ndarray,
+              valid: Optional[np.ndarray] = None, k: int = 10, cost: str = "skills",
+              chunk_size: int = 1024) -> "RoleGraph":
+        """
+        names / skills_lists / matrix / valid are aligned per catalog row (matrix is n x dim).
+        Rows where valid is False (blank CSV rows) become isolated nodes.
+        cost: "skills" (number of new skills) or "hours" (estimated learning hours).
+        """
+        if cost not in ("skills", "hours"):
+            raise ValueError("cost must be 'skills' or 'hours'")
+        n = len(names)
+        valid = np.ones(n, dtype=bool) if valid is None else np.asarray(valid, dtype=bool)
+        names = [name if ok else "" for name, ok in zip(names, valid)]
+        k = max(1, min(k, int(valid.sum()) - 1))
+
+        vocab = sorted({s for skills in skills_lists for s in skills})
+        vid = {s: i for i, s in enumerate(vocab)}
+        role_skills = [set(vid[s] for s in skills) for skills in skills_lists]
+        if cost == "hours":
+            hours = skill_hours(vocab)
+            skill_cost = np.array([hours[s] for s in vocab], dtype=np.float32)
+        else:
+            skill_cost = np.ones(len(vocab), dtype=np.float32)
+
+        X = np.asarray(matrix, dtype=np.float32)
+        X = X / np.maximum(np.linalg.norm(X, axis=1, keepdims=True), 1e-12)
+
+        # k nearest neighbours, chunked so the n x n similarity matrix is never materialized
+        neighbours = [set() for _ in range(n)]
+        for start in range(0, n, chunk_size):
+            sims = X[start:start + chunk_size] @ X.T
+            rows = np.arange(sims.shape[0])
+            sims[rows, rows + start] = -np.inf
+            sims[:, ~valid] = -np.inf
+            top = np.argpartition(-sims, k - 1, axis=1)[:, :k]
+            for r, js in enumerate(top):
+                i = start + r
+                if not valid[i]:
+                    continue
+                for j in js:
+                    neighbours[i].add(int(j))
+                    neighbours[int(j)].add(i)
+
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        indices, weights = [], []
+        for i in range(n):
+            for j in sorted(neighbours[i]):
+                gap = role_skills[j] - role_skills[i]
+                indices.append(j)
+                weights.append(float(skill_cost[list(gap)].sum()) if gap else 0.0)
+            indptr[i + 1] = len(indices)
+
+        skill_indptr = np.zeros(n + 1, dtype=np.int64)
+        skill_indices = []
+        for i, ids in enumerate(role_skills):
+            skill_indices.extend(sorted(ids))
+            skill_indptr[i + 1] = len(skill_indices)
+
+        return cls(
+            names,
+            indptr,
+            np.array(indices, dtype=np.int32),
+            np.array(weights, dtype=np.float32),
+            vocab,
+            skill_indptr,
+            np.array(skill_indices, dtype=np.int32),
+            meta={"k": k, "cost": cost, "roles": n, "edges": len(indices)},
+        )
+
+    def save(self, out_dir: Path):
+        out_dir = Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        np.save(out_dir / "indptr.npy", self.indptr)
+        np.save(out_dir / "indices.npy", self.indices)
+        np.save(out_dir / "weights.npy", self.weights)
+        np.save(out_dir / "skill_indptr.npy", self.skill_indptr)
+        np.save(out_dir / "skill_indices.npy", self.skill_indices)
+        with open(out_dir / "roles.json", "w", encoding="utf-8") as f:
+            json.dump({"names": self.names, "skill_vocab": self.skill_vocab, "meta": self.meta}, f)
+
+    @classmethod
+    def load(cls, graph_dir: Path, expected_fingerprint: Optional[str] = None) -> "RoleGraph":
+        graph_dir = Path(graph_dir)
+        with open(graph_dir / "roles.json", encoding="utf-8") as f:
+            header = json.load(f)
+        found = (header.get("meta") or {}).get("fingerprint")
+        if expected_fingerprint is not None and found != expected_fingerprint:
+            raise ValueError(f"Role graph in {graph_dir} was built for {found}, not {expected_fingerprint}")
+
+        def arr(name):
+            return np.load(graph_dir / name, mmap_mode="r")
+
+        return cls(
+            header["names"], arr("indptr.npy"), arr("indices.npy"), arr("weights.npy"),
+            header["skill_vocab"], arr("skill_indptr.npy"), arr("skill_indices.npy"),
+            meta=header.get("meta"),
+        )
+
+    # ---------------------------
+    # Queries
+    # ---------------------------
+    def index(self, role: str) -> Optional[int]:
+        return self._index.get((role or "").strip().lower())
+
+    def skills(self, i: int) -> List[str]:
+        return [self.skill_vocab[s] for s in self.skill_indices[self.skill_indptr[i]:self.skill_indptr[i + 1]]]
+
+    def shortest_path(self, source: int, target: int) -> Tuple[Optional[List[int]], float]:
+        """
+        Dijkstra from source to target, stopping as soon as target is settled.
+        Returns (node ids from source to target, total cost), or (None, inf) if unreachable.
+        """
+        dist = {source: 0.0}
+        prev = {}
+        heap = [(0.0, source)]
+        while heap:
+            d, u = heapq.heappop(heap)
+            if u == target:
+                path = [u]
+                while u in prev:
+                    u = prev[u]
+                    path.append(u)
+                return path[::-1], d
+            if d > dist.get(u, np.inf):
+                continue
+            lo, hi = self.indptr[u], self.indptr[u + 1]
+            for v, w in zip(self.indices[lo:hi].tolist(), self.weights[lo:hi].tolist()):
+                nd = d + w
+                if nd < dist.get(v, np.inf):
+                    dist[v] = nd
+                    prev[v] = u
+                    heapq.heappush(heap, (nd, v))
+        return None, float("inf")
+
+    def transition_path(self, from_role: str, to_role: str, from_row: Optional[int] = None) -> Optional[List[dict]]:
+        """
+        Hops from from_role to to_role, each with the new skills to learn.
+        from_row (the catalog row the recommender ranked) takes precedence over the name.
+        Returns None if either role is unknown or there is no path.
+        """
+        if from_row is not None and 0 <= from_row < len(self.names) and self.names[from_row]:
+            src = from_row
+        else:
+            src = self.index(from_role)
+        dst = self.index(to_role)
+        if src is None or dst is None:
+            return None
+        path, _ = self.shortest_path(src, dst)
+        if path is None:
+            return None
+
+        if self._hours is None and self.meta.get("cost") == "hours":
+            self._hours = skill_hours(self.skill_vocab)
+        hops = []
+        for a, b in zip(path, path[1:]):
+            new_skills = sorted(set(self.skills(b)) - set(self.skills(a)))
+            hop = {"from": self.names[a], "to": self.names[b], "new_skills": new_skills}
+            if self._hours is not None:
+                hop["estimated_hours"] = sum(self._hours[s] for s in new_skills)
+            hops.append(hop)
+        return hops
+
+
+def load_for_dataset(dataset_path: str | Path, model_name: str = DEFAULT_MODEL, root: Path = GRAPH_ROOT) -> RoleGraph:
+    """Load the graph built for exactly this dataset/model; raises if there is none."""
+    fp = fingerprint(dataset_path, model_name)
+    return RoleGraph.load(graph_dir(dataset_path, model_name, root), expected_fingerprint=fp)
+
+
+def build_from_recommender(dataset_path: str, k: int = 10, cost: str = "skills") -> RoleGraph:
+    """Build the graph from the same embeddings RoleRecommender scores with."""
+    from .recommender import RoleRecommender
+
+    cat = RoleRecommender(dataset_path).catalog
+    names = [cat.name(i) for i in range(len(cat))]
+    skills_lists = [cat.skills(i) for i in range(len(cat))]
+    graph = RoleGraph.build(names, skills_lists, cat.embeddings, valid=cat.valid, k=k, cost=cost)
+    graph.meta["fingerprint"] = fingerprint(dataset_path)
+    return graph
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Build the role-similarity graph")
+    parser.add_argument("--dataset", default=str(BASE_DIR / "data" / "it_job_roles.csv"))
+    parser.add_argument("--out", default=str(GRAPH_ROOT), help="root directory; the graph goes in a versioned subdirectory")
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--cost", choices=["skills", "hours"], default="skills")
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    graph = build_from_recommender(args.dataset, k=args.k, cost=args.cost)
+    out = graph_dir(args.dataset, root=Path(args.out))
+    graph.save(out)
+    print(f"Built role graph {graph.meta} in {time.perf_counter() - t0:.1f}s -> {out}")
@@ -1,7 +1,7 @@
 import re
-import pandas as pd
 from pathlib import Path
 from rapidfuzz import process, fuzz
+from .catalog import read_roles_csv
 
 COMMON_SKILL_ALIASES = {
     "js": "javascript",
@@ -22,7 +22,7 @@ def normalize_skill(s: str) -> str:
 def build_gazetteer(job_csv_path: str | Path = None):
     if job_csv_path is None:
         job_csv_path = Path(__file__).resolve().parent.parent / "data" / "it_job_roles.csv"
-    df = pd.read_csv(job_csv_path, encoding="latin1")
+    df = read_roles_csv(job_csv_path)
 
     skills = set()
     for col in ["required_skills", "certifications"]:
@@ -34,7 +34,16 @@ def build_gazetteer(job_csv_path: str | Path = None):
                         skills.add(normalize_skill(token))
     return sorted(skills)
 
-GLOSSARY = build_gazetteer()
+def _load_glossary():
+    # prefer the prebuilt artifact (python -m backend.utils.artifacts) over re-parsing the CSV
+    from .artifacts import load_glossary
+    try:
+        glossary = load_glossary()
+    except OSError:
+        glossary = None
+    return glossary if glossary is not None else build_gazetteer()
+
+GLOSSARY = _load_glossary()
 
 def extract_skills_from_text(text: str, glossary: list | None = None, fuzzy_threshold: int = 82):
     if glossary is None: